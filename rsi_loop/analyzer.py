@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
+import heapq
+import time
 from collections import defaultdict
+from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 
-from rsi_loop.observer import Observer
+from rsi_loop import _json
+from rsi_loop.observer import Observer, normalize_error
 from rsi_loop.types import HIGH_SEVERITY_ISSUES, Config, Outcome, Pattern
 
 
@@ -40,6 +45,55 @@ _CORRELATED_ISSUES: dict[frozenset[str], str] = {
     frozenset({"hydration_fail", "context_loss"}): "session_recovery",
 }
 
+_CORRELATION_RULES: list[tuple[frozenset[str], str]] = list(_CORRELATED_ISSUES.items())
+
+
+def _index_correlations(rules: list[tuple[frozenset[str], str]]) -> dict[str, list[int]]:
+    """Map each issue to the positions of the rules that mention it."""
+    index: dict[str, list[int]] = defaultdict(list)
+    for i, (pair, _) in enumerate(rules):
+        for issue in pair:
+            index[issue].append(i)
+    return dict(index)
+
+
+# Only rules touching an observed issue are checked
+_ISSUE_TO_CORRELATIONS = _index_correlations(_CORRELATION_RULES)
+
+_NO_ISSUE = ("none",)
+
+
+def _cluster_digest(norm_err: str) -> str:
+    """Short, process-stable id for an error cluster (hash() is salted per run)."""
+    return hashlib.blake2b(norm_err.encode(), digest_size=5).hexdigest()
+
+
+@dataclass(slots=True)
+class _GroupStats:
+    """Running totals for one outcome group, filled in a single pass."""
+
+    n: int = 0
+    failures: int = 0
+    quality_sum: int = 0
+    first_seen: str = ""
+    last_seen: str = ""
+    sources: set[str] = field(default_factory=set)
+    errors: list[str] = field(default_factory=list)
+
+    def add(self, o: Outcome) -> None:
+        self.n += 1
+        if not o.success:
+            self.failures += 1
+        self.quality_sum += o.quality
+        ts = o.timestamp
+        if not self.first_seen or ts < self.first_seen:
+            self.first_seen = ts
+        if ts > self.last_seen:
+            self.last_seen = ts
+        self.sources.add(o.source)
+        if o.error_message and len(self.errors) < 3:
+            self.errors.append(o.error_message)
+
 
 class Analyzer:
     """Detects improvement patterns from recorded outcomes."""
@@ -49,41 +103,59 @@ class Analyzer:
         self.observer = observer or Observer(self.config)
         self._data_dir = Path(self.config.data_dir)
         self._patterns_file = self._data_dir / "patterns.json"
+        # (store version, window days, epoch of oldest analyzed outcome) of the last run
+        self._last_run: tuple[tuple[int, int], int, float | None] | None = None
+        self._last_patterns: list[Pattern] = []
 
     def analyze(self, days: int | None = None) -> list[Pattern]:
-        """Scan outcomes and detect patterns. Returns ranked list by impact."""
+        """Scan outcomes and detect patterns. Returns ranked list by impact.
+
+        If nothing was recorded since the last call and no analyzed outcome
+        has left the window, the previous result is returned as-is (without
+        re-running recurrence detection).
+        """
         window = days or self.config.analysis_window_days
-        outcomes = self.observer.load_outcomes(days=window)
+        version = self.observer.store_version()
+        if version is None:
+            return []
+        if self._last_run is not None:
+            last_version, last_window, oldest = self._last_run
+            if (
+                last_version == version
+                and last_window == window
+                and (oldest is None or oldest >= time.time() - window * 86400)
+            ):
+                return list(self._last_patterns)
+
+        outcomes, oldest = self.observer.load_window(days=window)
         if not outcomes:
             return []
 
         patterns: list[Pattern] = []
         total = len(outcomes)
 
-        # ── Group by (task_type, issue) ────────────────────────────────────────
-        groups: dict[tuple[str, str], list[Outcome]] = defaultdict(list)
+        # ── Group by (task_type, issue) and by normalized error, in one pass ──
+        groups: dict[tuple[str, str], _GroupStats] = defaultdict(_GroupStats)
+        error_groups: dict[str, _GroupStats] = defaultdict(_GroupStats)
         for o in outcomes:
-            issues = o.issues or ["none"]
-            for issue in issues:
-                groups[(o.task_type, issue)].append(o)
+            for issue in o.issues or _NO_ISSUE:
+                groups[(o.task_type, issue)].add(o)
+            if o.error_message:
+                error_groups[normalize_error(o.error_message)].add(o)
 
-        for (task, issue), group in groups.items():
-            n = len(group)
+        for (task, issue), stats in groups.items():
+            n = stats.n
             min_threshold = 1 if issue in HIGH_SEVERITY_ISSUES else 2
             if n < min_threshold:
                 continue
 
-            failures = [o for o in group if not o.success]
-            failure_rate = len(failures) / n
-            avg_quality = sum(o.quality for o in group) / n
+            failure_rate = stats.failures / n
+            avg_quality = stats.quality_sum / n
             quality_deficit = 5.0 - avg_quality
             impact = (n / total) * quality_deficit
 
             category = _ISSUE_CATEGORIES.get(issue, "other")
             action = _CATEGORY_ACTIONS.get(category, "Investigate and address")
-            sources = sorted(set(o.source for o in group))
-            errors = [o.error_message for o in group if o.error_message][:3]
-            timestamps = sorted(o.timestamp for o in group)
 
             patterns.append(Pattern(
                 id=f"{task[:8]}-{issue[:8]}-{n}",
@@ -95,42 +167,34 @@ class Analyzer:
                 failure_rate=failure_rate,
                 description=f"In '{task}' tasks, '{issue}' occurs {n}x "
                             f"with {failure_rate:.0%} failure rate",
-                sample_errors=errors,
+                sample_errors=stats.errors,
                 suggested_action=action,
-                sources=sources,
-                first_seen=timestamps[0] if timestamps else "",
-                last_seen=timestamps[-1] if timestamps else "",
+                sources=sorted(stats.sources),
+                first_seen=stats.first_seen,
+                last_seen=stats.last_seen,
             ))
 
         # ── Error message clustering ──────────────────────────────────────────
-        error_groups: dict[str, list[Outcome]] = defaultdict(list)
-        for o in outcomes:
-            if o.error_message:
-                norm = Observer.normalize_error(o.error_message)
-                error_groups[norm].append(o)
-
-        for norm_err, err_outcomes in error_groups.items():
-            if len(err_outcomes) < 2:
+        for norm_err, stats in error_groups.items():
+            n = stats.n
+            if n < 2:
                 continue
-            n = len(err_outcomes)
-            failures = [o for o in err_outcomes if not o.success]
-            avg_quality = sum(o.quality for o in err_outcomes) / n
+            avg_quality = stats.quality_sum / n
             quality_deficit = 5.0 - avg_quality
             impact = (n / total) * quality_deficit
-            sources = sorted(set(o.source for o in err_outcomes))
 
             patterns.append(Pattern(
-                id=f"err-{hash(norm_err) % 99999:05d}-{n}",
+                id=f"err-{_cluster_digest(norm_err)}-{n}",
                 category="error_cluster",
                 task_type="mixed",
                 issue="error_cluster",
                 frequency=n,
                 impact_score=impact,
-                failure_rate=len(failures) / n,
+                failure_rate=stats.failures / n,
                 description=f"Error cluster ({n}x): {norm_err[:60]}",
-                sample_errors=[o.error_message for o in err_outcomes[:3]],
+                sample_errors=stats.errors,
                 suggested_action="Investigate common error pattern",
-                sources=sources,
+                sources=sorted(stats.sources),
             ))
 
         # ── Recurrence detection ──────────────────────────────────────────────
@@ -142,13 +206,14 @@ class Analyzer:
                 prev_freq = prev_patterns[key].get("frequency", 0)
                 p.trend = "increasing" if p.frequency > prev_freq else "stable"
 
-        # Sort by impact
-        patterns.sort(key=lambda p: -p.impact_score)
-        patterns = patterns[:20]
+        # Keep the 20 highest-impact patterns, sorted by impact
+        patterns = heapq.nlargest(20, patterns, key=attrgetter("impact_score"))
 
         # Save for next cycle's recurrence detection
         self._save_patterns(patterns)
-        return patterns
+        self._last_run = (version, window, oldest)
+        self._last_patterns = patterns
+        return list(patterns)
 
     def health_score(self, days: int | None = None) -> float:
         """Compute overall health score: 0.0 (broken) to 1.0 (healthy)."""
@@ -156,8 +221,14 @@ class Analyzer:
         if not outcomes:
             return 1.0  # No data = assume healthy
 
-        total_success = sum(1 for o in outcomes if o.success)
-        avg_quality = sum(o.quality for o in outcomes) / len(outcomes)
+        # One pass over the outcomes for both sums
+        total_success = 0
+        quality_sum = 0
+        for o in outcomes:
+            if o.success:
+                total_success += 1
+            quality_sum += o.quality
+        avg_quality = quality_sum / len(outcomes)
         return round((total_success / len(outcomes)) * (avg_quality / 5.0), 3)
 
     def cross_source_correlations(self, days: int | None = None) -> list[dict]:
@@ -169,8 +240,10 @@ class Analyzer:
                 issue_sources[issue].add(o.source)
 
         active = set(issue_sources.keys())
+        candidates = {i for iss in active for i in _ISSUE_TO_CORRELATIONS.get(iss, ())}
         correlations = []
-        for pair, name in _CORRELATED_ISSUES.items():
+        for i in sorted(candidates):
+            pair, name = _CORRELATION_RULES[i]
             if pair.issubset(active):
                 all_sources: set[str] = set()
                 for iss in pair:
@@ -187,17 +260,17 @@ class Analyzer:
         if not self._patterns_file.exists():
             return {}
         try:
-            with open(self._patterns_file) as f:
-                data = json.load(f)
+            with open(self._patterns_file, "rb") as f:
+                data = _json.loads(f.read())
             return {
                 (p.get("task_type", ""), p.get("issue", "")): p
                 for p in data.get("patterns", [])
             }
-        except (json.JSONDecodeError, OSError):
+        except (_json.JSONDecodeError, OSError):
             return {}
 
     def _save_patterns(self, patterns: list[Pattern]) -> None:
         self._data_dir.mkdir(parents=True, exist_ok=True)
         data = {"patterns": [p.to_dict() for p in patterns]}
-        with open(self._patterns_file, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(self._patterns_file, "wb") as f:
+            f.write(_json.dumps_pretty(data))
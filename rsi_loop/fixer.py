@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
+from rsi_loop import _json
 from rsi_loop.types import Config, Fix, Pattern
 
 # Issue → fix template mapping
@@ -48,13 +50,19 @@ class Fixer:
     """Generates fix proposals for detected patterns.
 
     Safe categories are auto-applicable; everything else produces a proposal
-    saved to disk for human review.
+    saved to disk for human review. Proposals are appended to a single
+    ``proposals.jsonl``; the latest line for a fix id wins.
     """
 
     def __init__(self, config: Config | None = None) -> None:
         self.config = config or Config()
         self._data_dir = Path(self.config.data_dir)
-        self._proposals_dir = self._data_dir / "proposals"
+        self._proposals_file = self._data_dir / "proposals.jsonl"
+        self._proposals_dir = self._data_dir / "proposals"  # pre-JSONL layout, read-only
+        # ((st_mtime_ns, st_size), fixes by id) for proposals.jsonl
+        self._log_cache: tuple[tuple[int, int], dict[str, Fix]] | None = None
+        # path → ((st_mtime_ns, st_size), parsed Fix) for legacy proposal files
+        self._proposal_cache: dict[str, tuple[tuple[int, int], Fix]] = {}
 
     def propose(self, pattern: Pattern) -> Fix:
         """Generate a fix proposal for a detected pattern."""
@@ -119,21 +127,79 @@ class Fixer:
         return fix
 
     def load_proposals(self) -> list[Fix]:
-        """Load all saved fix proposals."""
-        if not self._proposals_dir.exists():
+        """Load all saved fix proposals (latest version of each)."""
+        fixes = {fix.id: fix for fix in self._load_legacy_proposals()}
+        fixes.update(self._load_proposal_log())
+        return list(fixes.values())
+
+    def _load_proposal_log(self) -> dict[str, Fix]:
+        try:
+            st = self._proposals_file.stat()
+        except FileNotFoundError:
+            return {}
+        key = (st.st_mtime_ns, st.st_size)
+        if self._log_cache is not None and self._log_cache[0] == key:
+            return self._log_cache[1]
+
+        fixes: dict[str, Fix] = {}
+        with open(self._proposals_file, "rb") as f:
+            for line in f:
+                try:
+                    data = _json.loads(line)
+                except (_json.JSONDecodeError, ValueError):
+                    continue
+                if not isinstance(data, dict):
+                    continue
+                fix = Fix.from_dict(data)
+                fixes[fix.id] = fix
+        self._log_cache = (key, fixes)
+        return fixes
+
+    def _load_legacy_proposals(self) -> list[Fix]:
+        """Proposals written by older versions, one JSON file each."""
+        try:
+            with os.scandir(self._proposals_dir) as it:
+                entries = sorted(
+                    (e for e in it if e.name.endswith(".json")), key=lambda e: e.name
+                )
+        except FileNotFoundError:
             return []
+
+        cache: dict[str, tuple[tuple[int, int], Fix]] = {}
         proposals: list[Fix] = []
-        for path in sorted(self._proposals_dir.glob("*.json")):
+        for entry in entries:
             try:
-                with open(path) as f:
-                    proposals.append(Fix.from_dict(json.load(f)))
+                st = entry.stat()
+                key = (st.st_mtime_ns, st.st_size)
+                cached = self._proposal_cache.get(entry.path)
+                if cached is not None and cached[0] == key:
+                    fix = cached[1]
+                else:
+                    with open(entry.path) as f:
+                        fix = Fix.from_dict(json.load(f))
             except (json.JSONDecodeError, OSError):
                 continue
+            cache[entry.path] = (key, fix)
+            proposals.append(fix)
+        self._proposal_cache = cache
         return proposals
 
     def _save_proposal(self, fix: Fix) -> Path:
-        self._proposals_dir.mkdir(parents=True, exist_ok=True)
-        path = self._proposals_dir / f"{fix.id}.json"
-        with open(path, "w") as f:
-            json.dump(fix.to_dict(), f, indent=2)
-        return path
+        data = fix.to_dict()
+        logged = self._load_proposal_log().get(fix.id)
+        if logged is not None and logged.to_dict() == data:
+            return self._proposals_file  # Latest logged version is identical
+
+        line = _json.dumps_line(data)
+        self._data_dir.mkdir(parents=True, exist_ok=True)
+        with open(self._proposals_file, "ab") as f:
+            f.write(line)
+
+        # Keep the parsed log current with our own append, unless another
+        # writer appended in between; then the next load re-reads the file.
+        cache = self._log_cache
+        st = self._proposals_file.stat()
+        if cache is not None and st.st_size == cache[0][1] + len(line):
+            cache[1][fix.id] = Fix.from_dict(_json.loads(line))  # Not sharing fix's lists
+            self._log_cache = ((st.st_mtime_ns, st.st_size), cache[1])
+        return self._proposals_file
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from rsi_loop import _json
 from rsi_loop.loop import RSILoop
 from rsi_loop.types import Config, Outcome
 
@@ -41,21 +43,42 @@ class GenericAdapter:
             return []
 
         self._processed_dir.mkdir(parents=True, exist_ok=True)
-        outcomes: list[Outcome] = []
+        # scandir hands back names and file types from the directory read
+        # itself; no Path object or extra stat() per inbox entry.
+        with os.scandir(self._watch_dir) as it:
+            paths = sorted(
+                e.path
+                for e in it
+                if e.name.endswith(".json") and not e.name.startswith(".") and e.is_file()
+            )
+        if not paths:
+            return []
+
+        # Reads overlap on a thread pool; recording and moving stay sequential
+        # so outcomes.jsonl keeps the inbox order.
+        workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(_read_outcome, paths))
+
+        ready = [(path, o) for path, o in zip(paths, parsed) if o is not None]
+        try:
+            # A file whose outcome cannot be encoded is skipped and left in
+            # the inbox; the rest are still recorded and moved.
+            outcomes = self.loop.observer.record_many((o for _, o in ready), skip_invalid=True)
+            # With async_writes, only move files once their lines are on disk
+            self.loop.observer.flush()
+        except OSError:
+            return []
 
-        for path in sorted(self._watch_dir.glob("*.json")):
-            if path.name.startswith("."):
+        recorded = {id(o) for o in outcomes}
+        processed = os.fspath(self._processed_dir)
+        for path, o in ready:
+            if id(o) not in recorded:
                 continue
             try:
-                with open(path) as f:
-                    data = json.load(f)
-                outcome = Outcome.from_dict(data)
-                self.loop.observer.record(outcome)
-                outcomes.append(outcome)
-                path.rename(self._processed_dir / path.name)
-            except (json.JSONDecodeError, OSError):
+                os.rename(path, os.path.join(processed, os.path.basename(path)))
+            except OSError:
                 continue
-
         return outcomes
 
     def run_cycle(self):
@@ -65,3 +88,14 @@ class GenericAdapter:
 
     def health_score(self) -> float:
         return self.loop.health_score()
+
+
+def _read_outcome(path: str) -> Outcome | None:
+    try:
+        with open(path, "rb") as f:
+            data = _json.loads(f.read())
+        if not isinstance(data, dict):
+            return None
+        return Outcome.from_dict(data)
+    except (TypeError, ValueError, OSError):  # includes JSONDecodeError, bad UTF-8
+        return None
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import random
 import threading
 import time
 
@@ -29,6 +30,7 @@ class RSILoop:
         self.fixer = Fixer(self.config)
         self._background_thread: threading.Thread | None = None
         self._stop_event = threading.Event()
+        self._start_lock = threading.Lock()
 
     def run_cycle(self) -> list[Pattern]:
         """Run one observe → analyze → fix cycle. Returns detected patterns."""
@@ -49,19 +51,33 @@ class RSILoop:
         """Return all saved fix proposals."""
         return self.fixer.load_proposals()
 
-    def start_background(self, interval_seconds: int = 3600) -> None:
-        """Start the improvement loop in a background thread."""
-        if self._background_thread and self._background_thread.is_alive():
-            return
-        self._stop_event.clear()
-
-        def _loop() -> None:
-            while not self._stop_event.is_set():
-                self.run_cycle()
-                self._stop_event.wait(timeout=interval_seconds)
-
-        self._background_thread = threading.Thread(target=_loop, daemon=True)
-        self._background_thread.start()
+    def start_background(self, interval_seconds: int = 3600, jitter: float = 0.05) -> None:
+        """Start the improvement loop in a background thread.
+
+        Cycles start on a fixed ``interval_seconds`` grid: the time a cycle
+        takes is subtracted from the wait, and ticks missed by an overrunning
+        cycle are skipped rather than run back-to-back. Each wait is stretched
+        by a random ``0..jitter × interval`` so agents sharing an interval
+        don't all wake at once.
+        """
+        with self._start_lock:
+            if self._background_thread and self._background_thread.is_alive():
+                return
+            self._stop_event.clear()
+
+            def _loop() -> None:
+                while not self._stop_event.is_set():
+                    started = time.monotonic()
+                    self.run_cycle()
+                    delay = 0.0
+                    if interval_seconds > 0:
+                        elapsed = time.monotonic() - started
+                        delay = interval_seconds - (elapsed % interval_seconds)
+                        delay += random.uniform(0, interval_seconds * jitter)
+                    self._stop_event.wait(timeout=delay)
+
+            self._background_thread = threading.Thread(target=_loop, daemon=True)
+            self._background_thread.start()
 
     def stop_background(self) -> None:
         """Stop the background loop."""
@@ -2,36 +2,146 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import queue
 import re
+import threading
+import time
+import weakref
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
+from typing import BinaryIO
 
+from rsi_loop import _json
 from rsi_loop.types import ERROR_CLASSIFIERS, Config, Outcome
 
+# Upper bound on encoded lines waiting for the background writer; record()
+# blocks once it is reached.
+_WRITE_QUEUE_SIZE = 4096
+
+_HEX_RE = re.compile(r"[0-9a-f]{8,}")
+_NUM_RE = re.compile(r"\d+")
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_error(error: str) -> str:
+    """Normalize an error message for clustering (strip IDs, numbers).
+
+    Cached: agents tend to repeat the same handful of error strings.
+    """
+    normalized = error.lower().strip()
+    normalized = _HEX_RE.sub("<ID>", normalized)
+    normalized = _NUM_RE.sub("<N>", normalized)
+    return normalized[:120]
+
+
+def _write_all(fh: BinaryIO, buf: bytes) -> None:
+    """Write all of buf to a raw (unbuffered) file.
+
+    A raw write may be short, so the rest is written in further calls. A
+    batch large enough to need them can interleave with lines appended by
+    another process.
+    """
+    view = memoryview(buf)
+    while view:
+        view = view[fh.write(view):]
+
+
+def _drain(q: queue.Queue[bytes | None], path: Path, errors: list[OSError]) -> None:
+    """Background writer: append queued lines to path until a None sentinel arrives."""
+    fh: BinaryIO | None = None
+    try:
+        while True:
+            batch = [q.get()]
+            # Coalesce whatever else is already waiting into one write
+            while len(batch) < _WRITE_QUEUE_SIZE:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                payload = b"".join(buf for buf in batch if buf is not None)
+                if payload:
+                    if fh is None:
+                        path.parent.mkdir(parents=True, exist_ok=True)
+                        fh = open(path, "ab", buffering=0)
+                    _write_all(fh, payload)
+            except OSError as e:
+                errors.append(e)
+            finally:
+                for _ in batch:
+                    q.task_done()
+            if None in batch:
+                return
+    finally:
+        if fh is not None:
+            fh.close()
+
+
+def _stop_writer(q: queue.Queue[bytes | None], thread: threading.Thread) -> None:
+    q.put(None)
+    thread.join()
+
 
 class Observer:
     """Records agent task outcomes to a JSONL store.
 
     Framework-agnostic: works with any agent that can call ``record()``
     or ``record_simple()`` after each task.
+
+    With ``Config(async_writes=True)`` records are written by a background
+    thread; ``flush()`` waits for them, and reads flush first.
     """
 
     def __init__(self, config: Config | None = None) -> None:
         self.config = config or Config()
         self._data_dir = Path(self.config.data_dir)
         self._outcomes_file = self._data_dir / "outcomes.jsonl"
+        # ((mtime_ns, size, window_days), oldest kept epoch, outcomes)
+        self._cache: tuple[tuple[int, int, int], float | None, list[Outcome]] | None = None
+        self._fh: BinaryIO | None = None
+        self._lock = threading.Lock()
+        # (monotonic time, UTC ISO stamp) of the last clock read; see _now()
+        self._now_cache: tuple[float, str] = (float("-inf"), "")
+        # Background writer, started on first record() when async_writes is set.
+        # The thread holds no reference to the Observer; _writer_stop drains
+        # it on close(), garbage collection or interpreter exit.
+        self._writer_lock = threading.Lock()
+        self._queue: queue.Queue[bytes | None] | None = None
+        self._writer_stop: weakref.finalize | None = None
+        self._writer_errors: list[OSError] = []
 
     def record(self, outcome: Outcome) -> Outcome:
         """Record a full Outcome object. Auto-classifies issues from error_message."""
-        if outcome.error_message and not outcome.issues:
-            outcome.issues = self._classify_error(outcome.error_message)
-        outcome.quality = max(1, min(5, outcome.quality))
-
-        self._data_dir.mkdir(parents=True, exist_ok=True)
-        with open(self._outcomes_file, "a") as f:
-            f.write(json.dumps(outcome.to_dict()) + "\n")
+        self._write(self._encode(outcome))
         return outcome
 
+    def record_many(
+        self, outcomes: Iterable[Outcome], skip_invalid: bool = False
+    ) -> list[Outcome]:
+        """Record several outcomes with a single write to the store.
+
+        With ``skip_invalid``, outcomes that cannot be encoded (e.g. a
+        non-string error message) are left out of the write and of the
+        returned list instead of failing the whole batch.
+        """
+        recorded: list[Outcome] = []
+        lines: list[bytes] = []
+        for o in outcomes:
+            try:
+                lines.append(self._encode(o))
+            except (AttributeError, TypeError, ValueError):
+                if not skip_invalid:
+                    raise
+                continue
+            recorded.append(o)
+        if lines:
+            self._write(b"".join(lines))
+        return recorded
+
     def record_simple(
         self,
         task: str,
@@ -45,13 +155,16 @@ class Observer:
         notes: str = "",
     ) -> Outcome:
         """Convenience method — record an outcome with minimal arguments."""
-        issues: list[str] = []
+        issues: list[str]
         if error:
             issues = self._classify_error(error)
-        if not success and not issues:
+        elif not success:
             issues = ["other"]
+        else:
+            issues = []
 
         outcome = Outcome(
+            timestamp=self._now(),
             source=source,
             task_type=task,
             success=success,
@@ -66,57 +179,201 @@ class Observer:
         return self.record(outcome)
 
     def load_outcomes(self, days: int | None = None) -> list[Outcome]:
-        """Load outcomes from the JSONL store, optionally filtered by recency."""
-        if not self._outcomes_file.exists():
-            return []
+        """Load outcomes from the JSONL store, optionally filtered by recency.
+
+        The parsed result is reused while the file is unchanged and none of
+        the loaded outcomes has aged out of the window, so one analysis cycle
+        parses the store once.
+        """
+        return self.load_window(days)[0]
+
+    def load_window(self, days: int | None = None) -> tuple[list[Outcome], float | None]:
+        """Like ``load_outcomes()``, plus the epoch of the oldest returned outcome.
 
-        import time
-        from datetime import datetime
+        The epoch is None when no returned outcome carries a timestamp.
+        """
+        version = self.store_version()
+        if version is None:
+            return [], None
+
+        window = days or self.config.analysis_window_days
+        cutoff = time.time() - (window * 86400)
+        cutoff_epoch = int(cutoff)
+        # Rows carry an integer ts_epoch; older rows fall back to the ISO
+        # stamp. UTC stamps shaped like isoformat() output
+        # (YYYY-MM-DDTHH:MM:SS[.ffffff]+00:00) sort lexically, so only rows
+        # in some other format pay for fromisoformat().
+        cutoff_iso = datetime.fromtimestamp(cutoff, timezone.utc).isoformat()
+
+        key = (*version, window)
+        if self._cache is not None:
+            cached_key, cached_oldest, cached_outcomes = self._cache
+            if cached_key == key and (cached_oldest is None or cached_oldest >= cutoff_epoch):
+                return list(cached_outcomes), cached_oldest
 
-        cutoff = time.time() - ((days or self.config.analysis_window_days) * 86400)
         outcomes: list[Outcome] = []
+        oldest: float | None = None  # epoch of the oldest kept row
+        oldest_iso: str | None = None  # same, for rows with only a UTC ISO stamp
 
-        with open(self._outcomes_file) as f:
+        with open(self._outcomes_file, "rb") as f:
             for line in f:
-                line = line.strip()
-                if not line:
-                    continue
                 try:
-                    data = json.loads(line)
-                    ts_str = data.get("ts", data.get("timestamp", ""))
-                    if ts_str:
-                        ts = datetime.fromisoformat(ts_str).timestamp()
-                        if ts < cutoff:
+                    data = _json.loads(line)
+                    epoch = data.get("ts_epoch")
+                    if epoch is not None:
+                        if epoch < cutoff_epoch:
                             continue
+                        if oldest is None or epoch < oldest:
+                            oldest = epoch
+                    else:
+                        ts_str = data.get("ts", data.get("timestamp", ""))
+                        if (
+                            type(ts_str) is str
+                            and ts_str.endswith("+00:00")
+                            and ts_str[10:11] == "T"
+                            and ts_str[19:20] in (".", "+")
+                        ):
+                            if ts_str < cutoff_iso:
+                                continue
+                            if oldest_iso is None or ts_str < oldest_iso:
+                                oldest_iso = ts_str
+                        elif ts_str:
+                            ts = datetime.fromisoformat(ts_str).timestamp()
+                            if ts < cutoff:
+                                continue
+                            if oldest is None or ts < oldest:
+                                oldest = ts
                     outcomes.append(Outcome.from_dict(data))
-                except (json.JSONDecodeError, ValueError):
+                except (_json.JSONDecodeError, TypeError, ValueError):  # TypeError: non-str ts
                     continue
-        return outcomes
+
+        if oldest_iso is not None:
+            ts = datetime.fromisoformat(oldest_iso).timestamp()
+            oldest = ts if oldest is None else min(oldest, ts)
+        self._cache = (key, oldest, outcomes)
+        return list(outcomes), oldest
+
+    def store_version(self) -> tuple[int, int] | None:
+        """Token that changes whenever the outcome store changes; None if there is no store."""
+        self.flush()
+        try:
+            st = self._outcomes_file.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
 
     def recurrences(self, threshold: int | None = None) -> dict[str, int]:
         """Return issues that recur >= threshold times in the analysis window."""
         thresh = threshold or self.config.recurrence_threshold
         outcomes = self.load_outcomes()
-        counts: dict[str, int] = {}
-        for o in outcomes:
-            for issue in o.issues:
-                counts[issue] = counts.get(issue, 0) + 1
+        counts = Counter(chain.from_iterable(o.issues for o in outcomes))
         return {issue: count for issue, count in counts.items() if count >= thresh}
 
+    def flush(self) -> None:
+        """Wait until every recorded outcome is in the store.
+
+        A no-op unless ``async_writes`` is set. Re-raises the error of a
+        failed background write.
+        """
+        q = self._queue
+        if q is not None:
+            q.join()
+        if self._writer_errors:
+            error = self._writer_errors[0]
+            self._writer_errors.clear()
+            raise error
+
+    def close(self) -> None:
+        """Close the store's file handle. Recording again reopens it."""
+        with self._writer_lock:
+            stop, self._writer_stop, self._queue = self._writer_stop, None, None
+            if stop is not None:
+                stop()
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    def __del__(self) -> None:
+        fh = getattr(self, "_fh", None)
+        if fh is not None:
+            fh.close()
+
+    def _now(self) -> str:
+        """Current UTC timestamp, re-read from the clock at most once per millisecond.
+
+        Bursts of record_simple() calls share one formatted stamp instead of
+        building a datetime per outcome.
+        """
+        mono = time.monotonic()
+        last, stamp = self._now_cache
+        if mono - last >= 0.001:
+            stamp = datetime.now(timezone.utc).isoformat()
+            self._now_cache = (mono, stamp)
+        return stamp
+
+    def _encode(self, outcome: Outcome) -> bytes:
+        if outcome.error_message and not outcome.issues:
+            outcome.issues = self._classify_error(outcome.error_message)
+        outcome.quality = max(1, min(5, outcome.quality))
+        data = outcome.to_dict()
+        try:
+            # Lets load_outcomes() filter by window with an int compare
+            data["ts_epoch"] = int(datetime.fromisoformat(outcome.timestamp).timestamp())
+        except (TypeError, ValueError):
+            pass
+        return _json.dumps_line(data)
+
+    def _write(self, buf: bytes) -> None:
+        if not self.config.async_writes:
+            self._append(buf)
+            return
+        # Put under the writer lock so close() cannot retire the queue
+        # between picking it and putting on it.
+        with self._writer_lock:
+            if self._queue is None:
+                self._start_writer()
+            self._queue.put(buf)
+
+    def _start_writer(self) -> None:
+        # Called with _writer_lock held
+        q: queue.Queue[bytes | None] = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
+        thread = threading.Thread(
+            target=_drain,
+            args=(q, self._outcomes_file, self._writer_errors),
+            name="rsi-observer-writer",
+            daemon=True,
+        )
+        thread.start()
+        self._queue = q
+        self._writer_stop = weakref.finalize(self, _stop_writer, q, thread)
+
+    def _append(self, buf: bytes) -> None:
+        # Unbuffered O_APPEND handle: every write(2) lands at the current end
+        # of the file, even with several writers.
+        with self._lock:
+            if self._fh is None:
+                self._data_dir.mkdir(parents=True, exist_ok=True)
+                self._fh = open(self._outcomes_file, "ab", buffering=0)
+            _write_all(self._fh, buf)
+            self._cache = None
+
     @staticmethod
     def _classify_error(error: str) -> list[str]:
         """Auto-classify an error message into issue types."""
         lower = error.lower()
         issues: list[str] = []
+        # Plain loops over C-level substring checks: measurably faster than
+        # any() generators or one big alternation regex for short messages.
         for keywords, issue_type in ERROR_CLASSIFIERS:
-            if any(kw in lower for kw in keywords):
-                issues.append(issue_type)
+            for kw in keywords:
+                if kw in lower:
+                    if issue_type not in issues:
+                        issues.append(issue_type)
+                    break
         return issues or ["other"]
 
     @staticmethod
     def normalize_error(error: str) -> str:
         """Normalize an error message for clustering (strip IDs, numbers)."""
-        normalized = error.lower().strip()
-        normalized = re.sub(r"[0-9a-f]{8,}", "<ID>", normalized)
-        normalized = re.sub(r"\d+", "<N>", normalized)
-        return normalized[:120]
+        return normalize_error(error)
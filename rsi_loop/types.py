@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-import uuid
+import os
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Any
 
 
@@ -13,12 +15,23 @@ def _utcnow() -> str:
 
 
 def _short_id() -> str:
-    return str(uuid.uuid4())[:8]
+    return os.urandom(4).hex()
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_issues(issues: Any) -> Any:
+    # Hand-written rows may carry null or some other non-list value
+    if isinstance(issues, (list, tuple)):
+        return [_intern(i) for i in issues]
+    return issues or []
 
 
 # ── Issue taxonomy ─────────────────────────────────────────────────────────────
 
-ISSUE_TYPES: set[str] = {
+ISSUE_TYPES: frozenset[str] = frozenset({
     # Model / routing
     "rate_limit", "model_fallback", "wrong_model_tier", "cost_overrun",
     "bad_routing", "slow_response",
@@ -35,12 +48,12 @@ ISSUE_TYPES: set[str] = {
     "timeout",
     # Catch-all
     "other",
-}
+})
 
-HIGH_SEVERITY_ISSUES: set[str] = {
+HIGH_SEVERITY_ISSUES: frozenset[str] = frozenset({
     "tool_error", "wrong_output", "empty_response",
     "session_reset", "cost_overrun", "wal_miss",
-}
+})
 
 # ── Error keyword → issue mapping for auto-classification ─────────────────────
 
@@ -57,7 +70,14 @@ ERROR_CLASSIFIERS: list[tuple[list[str], str]] = [
 ]
 
 
-@dataclass
+# Keys written by Outcome.to_dict(), in field order
+_OUTCOME_KEYS = itemgetter(
+    "id", "ts", "source", "task_type", "success", "quality", "issues",
+    "error_message", "model", "duration_ms", "notes", "tags", "metadata",
+)
+
+
+@dataclass(slots=True)
 class Outcome:
     """A single task outcome recorded by an agent."""
 
@@ -83,7 +103,7 @@ class Outcome:
             "task_type": self.task_type,
             "success": self.success,
             "quality": max(1, min(5, self.quality)),
-            "issues": self.issues,
+            "issues": list(self.issues),
             "error_message": self.error_message,
             "model": self.model,
             "duration_ms": self.duration_ms,
@@ -94,16 +114,43 @@ class Outcome:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Outcome:
+        # Low-cardinality labels are interned so a large loaded window shares
+        # one string object per distinct value instead of one per row.
+        try:
+            # Fast path: rows written by to_dict() carry every key
+            (id_, ts, source, task_type, success, quality, issues,
+             error_message, model, duration_ms, notes, tags, metadata) = _OUTCOME_KEYS(data)
+        except KeyError:
+            return cls._from_partial_dict(data)
+        return cls(
+            id=id_,
+            timestamp=ts,
+            source=_intern(source),
+            task_type=_intern(task_type),
+            success=success,
+            quality=quality,
+            issues=_intern_issues(issues),
+            error_message=error_message,
+            model=_intern(model),
+            duration_ms=duration_ms,
+            notes=notes,
+            tags=tags,
+            metadata=metadata,
+        )
+
+    @classmethod
+    def _from_partial_dict(cls, data: dict[str, Any]) -> Outcome:
+        """Build from a hand-written or legacy row: defaults and alternate key names."""
         return cls(
             id=data.get("id", _short_id()),
             timestamp=data.get("ts", data.get("timestamp", _utcnow())),
-            source=data.get("source", "generic"),
-            task_type=data.get("task_type", data.get("task", "unknown")),
+            source=_intern(data.get("source", "generic")),
+            task_type=_intern(data.get("task_type", data.get("task", "unknown"))),
             success=data.get("success", True),
             quality=data.get("quality", 3),
-            issues=data.get("issues", []),
+            issues=_intern_issues(data.get("issues")),
             error_message=data.get("error_message", data.get("error_msg", data.get("error", ""))),
-            model=data.get("model", ""),
+            model=_intern(data.get("model", "")),
             duration_ms=data.get("duration_ms", 0),
             notes=data.get("notes", ""),
             tags=data.get("tags", []),
@@ -111,7 +158,7 @@ class Outcome:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Pattern:
     """A detected improvement pattern from analyzed outcomes."""
 
@@ -155,7 +202,7 @@ class Pattern:
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
-@dataclass
+@dataclass(slots=True)
 class Fix:
     """A fix proposal or applied fix for a detected pattern."""
 
@@ -187,7 +234,7 @@ class Fix:
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Configuration for RSI Loop."""
 
@@ -195,6 +242,8 @@ class Config:
     analysis_window_days: int = 7
     recurrence_threshold: int = 3
     auto_fix_enabled: bool = True
+    # Hand record() writes to a background thread instead of writing inline
+    async_writes: bool = False
     safe_categories: list[str] = field(
         default_factory=lambda: ["routing_config", "threshold_tuning", "retry_logic"]
     )
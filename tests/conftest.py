@@ -0,0 +1,15 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from rsi_loop import _json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test once with orjson and once with the stdlib json fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(_json, "orjson", None)
+    elif _json.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
@@ -1,10 +1,16 @@
 """Tests for the Analyzer module."""
 
+import hashlib
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
 import pytest
 
 from rsi_loop.analyzer import Analyzer
 from rsi_loop.observer import Observer
-from rsi_loop.types import Config
+from rsi_loop.types import Config, Outcome
 
 
 @pytest.fixture
@@ -102,6 +108,15 @@ class TestAnalyzer:
         # Should find error_cluster or tool_reliability
         assert len(patterns) > 0
 
+    def test_error_cluster_id_is_stable(self, tmp_config):
+        obs = Observer(tmp_config)
+        for _ in range(2):
+            obs.record_simple("api", success=False, error="Upstream said no")
+        patterns = Analyzer(tmp_config, observer=obs).analyze()
+        cluster = next(p for p in patterns if p.category == "error_cluster")
+        digest = hashlib.blake2b(b"upstream said no", digest_size=5).hexdigest()
+        assert cluster.id == f"err-{digest}-2"
+
     def test_cross_source_correlations(self, tmp_config):
         obs = Observer(tmp_config)
         obs.record_simple("task", success=False, error="session reset", source="svc_a")
@@ -112,6 +127,22 @@ class TestAnalyzer:
         if corr:
             assert corr[0]["correlation"] == "context_management"
 
+    def test_cross_source_correlations_table_order(self, tmp_config):
+        obs = Observer(tmp_config)
+        obs.record_simple("task", success=False, error="empty response", source="svc_a")
+        obs.record_simple("task", success=False, error="connection reset", source="svc_b")
+        obs.record_simple("task", success=False, error="session reset", source="svc_a")
+        obs.record_simple("task", success=False, error="context length exceeded", source="svc_b")
+        obs.record_simple("task", success=False, error="429 rate limit", source="svc_c")
+        a = Analyzer(tmp_config, observer=obs)
+        corr = a.cross_source_correlations()
+        assert [c["correlation"] for c in corr] == ["context_management", "tool_reliability"]
+        assert corr[1] == {
+            "issues": ["empty_response", "tool_error"],
+            "correlation": "tool_reliability",
+            "sources": ["svc_a", "svc_b"],
+        }
+
     def test_recurrence_detection(self, tmp_config):
         obs = Observer(tmp_config)
         a = Analyzer(tmp_config, observer=obs)
@@ -129,6 +160,55 @@ class TestAnalyzer:
         if rate_patterns:
             assert rate_patterns[0].recurring is True
 
+    @pytest.mark.usefixtures("json_backend")
+    def test_patterns_file_saved(self, populated_analyzer, tmp_config):
+        patterns = populated_analyzer.analyze()
+        text = (Path(tmp_config.data_dir) / "patterns.json").read_text()
+        saved = json.loads(text)["patterns"]
+        assert [p["id"] for p in saved] == [p.id for p in patterns]
+        assert saved[0]["impact_score"] == round(patterns[0].impact_score, 4)
+        assert text.startswith('{\n  "patterns"')
+
+    def test_analyze_reuses_result_when_store_unchanged(self, populated_analyzer, monkeypatch):
+        first = populated_analyzer.analyze()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("store should not be re-read")
+
+        with monkeypatch.context() as m:
+            m.setattr(populated_analyzer.observer, "load_window", fail)
+            again = populated_analyzer.analyze()
+        assert [p.id for p in again] == [p.id for p in first]
+
+        populated_analyzer.observer.record_simple("api_call", success=False, error="429")
+        after = populated_analyzer.analyze()
+        rate = next(p for p in after if p.issue == "rate_limit" and p.task_type == "api_call")
+        assert rate.frequency == 5
+
+    def test_analyze_reruns_when_outcomes_age_out(self, populated_analyzer):
+        populated_analyzer.analyze()
+        version, window, _ = populated_analyzer._last_run
+        populated_analyzer._last_run = (version, window, 0.0)  # Oldest outcome now outside window
+        patterns = populated_analyzer.analyze()
+        assert patterns and all(p.recurring for p in patterns if p.category != "error_cluster")
+
+    def test_analyze_reruns_when_offset_stamped_outcome_ages_out(self, tmp_config, monkeypatch):
+        # The true oldest row sorts after the newer one as text
+        now = datetime.now(timezone.utc)
+        old = (now - timedelta(hours=20)).astimezone(timezone(timedelta(hours=14)))
+        new = (now - timedelta(hours=2)).astimezone(timezone(timedelta(hours=-12)))
+        assert old.isoformat() > new.isoformat()
+        obs = Observer(tmp_config)
+        for ts in (old, old, new, new):
+            obs.record(Outcome(task_type="api", success=False, issues=["timeout"],
+                               timestamp=ts.isoformat()))
+        a = Analyzer(tmp_config, observer=obs)
+        assert a.analyze(days=1)[0].frequency == 4
+
+        later = time.time() + 6 * 3600
+        monkeypatch.setattr(time, "time", lambda: later)
+        assert a.analyze(days=1)[0].frequency == 2
+
     def test_max_20_patterns(self, tmp_config):
         obs = Observer(tmp_config)
         # Create many different issue types
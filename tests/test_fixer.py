@@ -1,5 +1,8 @@
 """Tests for the Fixer module."""
 
+import json
+from pathlib import Path
+
 import pytest
 
 from rsi_loop.fixer import Fixer
@@ -83,6 +86,62 @@ class TestFixer:
         proposals = fixer.load_proposals()
         assert len(proposals) == 3
 
+    def test_load_proposals_reuses_unchanged(self, fixer):
+        fix = fixer.propose_and_apply(_make_pattern("rate_limit"))
+        first = fixer.load_proposals()
+        assert fixer.load_proposals()[0] is first[0]
+
+        fix.description = "Reviewed: raise backoff ceiling"
+        fixer.apply_if_safe(fix)  # Rewrites the proposal file
+        reloaded = fixer.load_proposals()[0]
+        assert reloaded is not first[0]
+        assert reloaded.description == "Reviewed: raise backoff ceiling"
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_latest_proposal_version_wins(self, fixer, tmp_config):
+        fix = fixer.propose(_make_pattern("session_reset"))
+        fixer.apply_if_safe(fix)
+        fix.status = "rejected"
+        fixer._save_proposal(fix)
+        fixer._save_proposal(fix)  # Unchanged: not appended again
+
+        proposals = fixer.load_proposals()
+        assert [(p.id, p.status) for p in proposals] == [(fix.id, "rejected")]
+        log = Path(tmp_config.data_dir) / "proposals.jsonl"
+        assert len(log.read_text().splitlines()) == 2
+
+    def test_resave_after_in_place_change_is_appended(self, fixer, tmp_config):
+        fix = fixer.propose(_make_pattern("rate_limit"))
+        fixer.apply_if_safe(fix)
+        fix.status = "rejected"
+        fixer._save_proposal(fix)
+        fix.changes[0]["detail"] = "Edited in place"
+        fixer._save_proposal(fix)
+
+        log = Path(tmp_config.data_dir) / "proposals.jsonl"
+        assert len(log.read_text().splitlines()) == 3
+        assert fixer.load_proposals()[0].changes[0]["detail"] == "Edited in place"
+
+    def test_load_proposals_skips_non_object_lines(self, fixer, tmp_config):
+        fix = fixer.propose(_make_pattern("rate_limit"))
+        fixer.apply_if_safe(fix)
+        with open(Path(tmp_config.data_dir) / "proposals.jsonl", "a") as f:
+            f.write("null\n[]\n\"text\"\n")
+        assert [p.id for p in fixer.load_proposals()] == [fix.id]
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_load_legacy_proposal_files(self, fixer, tmp_config):
+        legacy = _make_pattern("rate_limit")
+        old_fix = fixer.propose(legacy)
+        legacy_dir = Path(tmp_config.data_dir) / "proposals"
+        legacy_dir.mkdir(parents=True)
+        (legacy_dir / f"{old_fix.id}.json").write_text(json.dumps(old_fix.to_dict()))
+
+        assert [p.id for p in fixer.load_proposals()] == [old_fix.id]
+        old_fix.status = "rejected"
+        fixer._save_proposal(old_fix)
+        assert [p.status for p in fixer.load_proposals()] == ["rejected"]
+
     def test_load_proposals_empty(self, fixer):
         assert fixer.load_proposals() == []
 
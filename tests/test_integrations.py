@@ -65,6 +65,7 @@ class TestGenericAdapter:
         )
         assert adapter.poll() == []
 
+    @pytest.mark.usefixtures("json_backend")
     def test_poll_ingests_files(self, tmp_path):
         inbox = tmp_path / "inbox"
         inbox.mkdir()
@@ -91,6 +92,23 @@ class TestGenericAdapter:
         assert not (inbox / "outcome1.json").exists()
         assert (inbox / ".processed" / "outcome1.json").exists()
 
+    def test_poll_many_files_keeps_order(self, tmp_path):
+        inbox = tmp_path / "inbox"
+        inbox.mkdir()
+        for i in range(50):
+            (inbox / f"out{i:03d}.json").write_text(json.dumps({"task": f"t{i:03d}"}))
+
+        adapter = GenericAdapter(
+            watch_dir=str(inbox),
+            data_dir=str(tmp_path / "rsi"),
+        )
+        outcomes = adapter.poll()
+        expected = [f"t{i:03d}" for i in range(50)]
+        assert [o.task_type for o in outcomes] == expected
+        loaded = adapter.loop.observer.load_outcomes(days=1)
+        assert [o.task_type for o in loaded] == expected
+        assert not list(inbox.glob("*.json"))
+
     def test_poll_skips_bad_json(self, tmp_path):
         inbox = tmp_path / "inbox"
         inbox.mkdir()
@@ -104,6 +122,50 @@ class TestGenericAdapter:
         outcomes = adapter.poll()
         assert len(outcomes) == 1
 
+    def test_poll_skips_undecodable_file_and_directories(self, tmp_path):
+        inbox = tmp_path / "inbox"
+        inbox.mkdir()
+        (inbox / "latin1.json").write_bytes(b'{"task": "caf\xe9"}')
+        (inbox / "nested.json").mkdir()
+        (inbox / "good.json").write_text(json.dumps({"task": "ok", "success": True}))
+
+        adapter = GenericAdapter(
+            watch_dir=str(inbox),
+            data_dir=str(tmp_path / "rsi"),
+        )
+        outcomes = adapter.poll()
+        assert [o.task_type for o in outcomes] == ["ok"]
+        assert (inbox / "latin1.json").exists()
+
+    def test_poll_skips_unrecordable_files(self, tmp_path):
+        inbox = tmp_path / "inbox"
+        inbox.mkdir()
+        (inbox / "a.json").write_text(json.dumps({"task": "ok1", "success": True}))
+        (inbox / "b.json").write_text(json.dumps({"task": "bad", "success": False, "error": 123}))
+        (inbox / "c.json").write_text(json.dumps([1, 2]))
+        (inbox / "d.json").write_text(json.dumps({"task": "ok2", "ts": 1760000000}))
+
+        adapter = GenericAdapter(
+            watch_dir=str(inbox),
+            data_dir=str(tmp_path / "rsi"),
+        )
+        outcomes = adapter.poll()
+        assert [o.task_type for o in outcomes] == ["ok1", "ok2"]
+        assert sorted(p.name for p in inbox.glob("*.json")) == ["b.json", "c.json"]
+
+    def test_poll_async_write_failure_keeps_inbox(self, tmp_path):
+        inbox = tmp_path / "inbox"
+        inbox.mkdir()
+        for i in range(3):
+            (inbox / f"{i}.json").write_text(json.dumps({"task": f"t{i}", "success": True}))
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+
+        adapter = GenericAdapter(watch_dir=str(inbox), data_dir=str(blocker), async_writes=True)
+        assert adapter.poll() == []
+        assert sorted(p.name for p in inbox.glob("*.json")) == ["0.json", "1.json", "2.json"]
+        adapter.loop.observer.close()
+
     def test_poll_skips_dotfiles(self, tmp_path):
         inbox = tmp_path / "inbox"
         inbox.mkdir()
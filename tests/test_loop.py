@@ -1,5 +1,6 @@
 """Tests for the RSILoop module."""
 
+import threading
 import time
 
 import pytest
@@ -77,6 +78,34 @@ class TestRSILoop:
         loop.start_background(interval_seconds=60)  # Should not create second thread
         loop.stop_background()
 
+    def test_background_loop_concurrent_start(self, loop):
+        threads = [
+            threading.Thread(target=loop.start_background, kwargs={"interval_seconds": 60})
+            for _ in range(8)
+        ]
+        started = threading.active_count()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert threading.active_count() == started + 1  # One loop thread
+        loop.stop_background()
+
+    def test_background_loop_waits_remaining_interval(self, loop, monkeypatch):
+        waits = []
+
+        def fake_wait(timeout=None):
+            waits.append(timeout)
+            loop._stop_event.set()
+            return True
+
+        monkeypatch.setattr(loop._stop_event, "wait", fake_wait)
+        loop.run_cycle = lambda: time.sleep(0.2)
+        loop.start_background(interval_seconds=1, jitter=0)
+        loop._background_thread.join(timeout=5)
+        assert len(waits) == 1
+        assert 0.7 < waits[0] <= 0.8
+
     def test_stop_without_start(self, loop):
         loop.stop_background()  # Should not crash
 
@@ -1,12 +1,16 @@
 """Tests for the Observer module."""
 
+import gc
 import json
 import tempfile
+import threading
+import weakref
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
-from rsi_loop.observer import Observer
+from rsi_loop.observer import Observer, _write_all, normalize_error
 from rsi_loop.types import Config, Outcome
 
 
@@ -21,12 +25,16 @@ def observer(tmp_config):
 
 
 class TestObserver:
+    @pytest.mark.usefixtures("json_backend")
     def test_record_simple_success(self, observer):
         o = observer.record_simple("code_gen", success=True, model="sonnet-4.6")
         assert o.success is True
         assert o.task_type == "code_gen"
         assert o.model == "sonnet-4.6"
         assert o.quality == 3
+        assert o.issues == []
+        assert Outcome.from_dict(o.to_dict()) == o
+        assert observer.load_outcomes(days=1)[0] == o
 
     def test_record_simple_failure(self, observer):
         o = observer.record_simple("api_call", success=False, error="Connection refused")
@@ -54,6 +62,12 @@ class TestObserver:
         o = observer.record_simple("task", success=False, error="Something weird happened")
         assert "other" in o.issues
 
+    def test_record_simple_failure_without_error(self, observer):
+        o = observer.record_simple("task", success=False)
+        assert o.issues == ["other"]
+        loaded = observer.load_outcomes(days=1)
+        assert loaded[0].issues == ["other"]
+
     def test_record_full_outcome(self, observer):
         outcome = Outcome(
             source="openclaw",
@@ -85,6 +99,183 @@ class TestObserver:
         outcomes = observer.load_outcomes(days=1)
         assert len(outcomes) == 2
 
+    @pytest.mark.usefixtures("json_backend")
+    def test_load_outcomes_window(self, observer, tmp_config):
+        observer.record(Outcome(task_type="old", timestamp="2020-01-01T00:00:00+00:00"))
+        observer.record(Outcome(task_type="old_offset", timestamp="2020-01-01T10:00:00+10:00"))
+        observer.record_simple("fresh", success=True)
+        with open(Path(tmp_config.data_dir) / "outcomes.jsonl", "a") as f:
+            # Rows written before ts_epoch existed
+            f.write(json.dumps({"task": "legacy_old", "ts": "2020-01-01T10:00:00+10:00"}) + "\n")
+            f.write(json.dumps(Outcome(task_type="legacy_fresh").to_dict()) + "\n")
+            f.write("\n{broken\n")
+        outcomes = observer.load_outcomes(days=1)
+        assert [o.task_type for o in outcomes] == ["fresh", "legacy_fresh"]
+
+    def test_load_outcomes_window_non_t_separator(self, observer, tmp_config):
+        # str(datetime) uses a space separator, which must not be compared as text
+        now = datetime.now(timezone.utc)
+        Path(tmp_config.data_dir).mkdir(parents=True)
+        with open(Path(tmp_config.data_dir) / "outcomes.jsonl", "a") as f:
+            for task, age in (("recent", 23), ("stale", 25)):
+                ts = str((now - timedelta(hours=age)).replace(microsecond=0))
+                f.write(json.dumps({"task": task, "ts": ts}) + "\n")
+        assert [o.task_type for o in observer.load_outcomes(days=1)] == ["recent"]
+
+    def test_record_writes_epoch(self, observer, tmp_config):
+        o = observer.record(Outcome(timestamp="2026-01-01T00:00:00+00:00"))
+        line = (Path(tmp_config.data_dir) / "outcomes.jsonl").read_text().splitlines()[0]
+        data = json.loads(line)
+        assert data["ts"] == o.timestamp
+        assert data["ts_epoch"] == 1767225600
+
+    def test_record_non_string_timestamp(self, observer, tmp_config):
+        observer.record(Outcome(task_type="epoch_ts", timestamp=1760000000))
+        line = (Path(tmp_config.data_dir) / "outcomes.jsonl").read_text().splitlines()[0]
+        assert "ts_epoch" not in json.loads(line)
+        observer.record_simple("fresh", success=True)
+        # The malformed row is skipped on load, like an unparseable stamp
+        assert [o.task_type for o in observer.load_outcomes(days=1)] == ["fresh"]
+
+    def test_load_outcomes_cached_until_store_changes(self, observer, tmp_config):
+        observer.record_simple("task1", success=True)
+        first = observer.load_outcomes(days=1)
+        assert observer.load_outcomes(days=1)[0] is first[0]
+
+        # Appended by another process: size/mtime change invalidates the cache
+        with open(Path(tmp_config.data_dir) / "outcomes.jsonl", "a") as f:
+            f.write(json.dumps(Outcome(task_type="external").to_dict()) + "\n")
+        assert [o.task_type for o in observer.load_outcomes(days=1)] == ["task1", "external"]
+
+    def test_record_simple_reuses_timestamp_within_millisecond(self, observer, monkeypatch):
+        clock = [100.0]
+        monkeypatch.setattr("rsi_loop.observer.time.monotonic", lambda: clock[0])
+        a = observer.record_simple("task1", success=True)
+        b = observer.record_simple("task2", success=True)
+        assert a.timestamp == b.timestamp
+        clock[0] += 0.002
+        c = observer.record_simple("task3", success=True)
+        assert c.timestamp >= a.timestamp
+        assert c.timestamp.endswith("+00:00")
+
+    def test_outcome_dict_round_trip(self):
+        o = Outcome(task_type="api", success=False, quality=2, issues=["timeout"],
+                    error_message="timed out", model="m", duration_ms=5, notes="n",
+                    tags=["t"], metadata={"k": 1})
+        assert Outcome.from_dict(o.to_dict()) == o
+        legacy = Outcome.from_dict({"task": "api", "error": "boom", "timestamp": o.timestamp})
+        assert (legacy.task_type, legacy.error_message) == ("api", "boom")
+        assert legacy.timestamp == o.timestamp
+        assert legacy.source == "generic" and legacy.issues == []
+
+    def test_load_outcomes_null_issues(self, observer, tmp_config):
+        full = Outcome(task_type="full", success=False).to_dict()
+        full["issues"] = None
+        Path(tmp_config.data_dir).mkdir(parents=True)
+        with open(Path(tmp_config.data_dir) / "outcomes.jsonl", "a") as f:
+            f.write(json.dumps(full) + "\n")
+            f.write(json.dumps({"task": "partial", "issues": None}) + "\n")
+        loaded = observer.load_outcomes(days=1)
+        assert [(o.task_type, o.issues) for o in loaded] == [("full", []), ("partial", [])]
+        assert observer.recurrences(threshold=1) == {}
+
+    def test_loaded_labels_are_shared(self, observer):
+        for _ in range(2):
+            observer.record_simple("api_call", success=False, error="429", model="sonnet-4.6")
+        a, b = observer.load_outcomes(days=1)
+        assert a.task_type is b.task_type
+        assert a.model is b.model
+        assert a.issues[0] is b.issues[0]
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_record_many(self, observer):
+        recorded = observer.record_many([
+            Outcome(task_type="api", success=False, error_message="429 Too Many Requests"),
+            Outcome(task_type="search", success=True),
+        ])
+        assert "rate_limit" in recorded[0].issues
+        assert [o.task_type for o in observer.load_outcomes(days=1)] == ["api", "search"]
+
+    def test_close_and_reopen(self, observer):
+        observer.record_simple("task1", success=True)
+        observer.close()
+        observer.close()  # Idempotent
+        observer.record_simple("task2", success=True)
+        assert len(observer.load_outcomes(days=1)) == 2
+
+    def test_async_writes(self, tmp_path):
+        observer = Observer(Config(data_dir=str(tmp_path / "rsi_data"), async_writes=True))
+        for i in range(100):
+            failed = i % 2 == 1
+            observer.record_simple(f"t{i:03d}", success=not failed, error="429" if failed else None)
+        observer.record_many([Outcome(task_type="t100"), Outcome(task_type="t101")])
+        # Reads flush the writer first, so nothing recorded is missed
+        loaded = observer.load_outcomes(days=1)
+        assert [o.task_type for o in loaded] == [f"t{i:03d}" for i in range(102)]
+        assert observer.recurrences(threshold=3) == {"rate_limit": 50}
+
+        observer.close()
+        observer.record_simple("after_close", success=True)
+        observer.flush()
+        assert len(Observer(observer.config).load_outcomes(days=1)) == 103
+        observer.close()
+
+    def test_async_close_while_recording(self, tmp_path):
+        observer = Observer(Config(data_dir=str(tmp_path / "rsi_data"), async_writes=True))
+
+        errors = []
+
+        def record():
+            try:
+                for _ in range(200):
+                    observer.record_simple("task", success=True)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for t in threads:
+            t.start()
+        while any(t.is_alive() for t in threads):
+            observer.close()  # Retires the writer; the next record starts a new one
+        for t in threads:
+            t.join()
+        observer.close()
+        assert errors == []
+        assert len(observer.load_outcomes(days=1)) == 800
+
+    def test_async_observer_is_collected_and_drained(self, tmp_path):
+        config = Config(data_dir=str(tmp_path / "rsi_data"), async_writes=True)
+        observer = Observer(config)
+        observer.record_simple("task1", success=True)
+        ref = weakref.ref(observer)
+        del observer
+        gc.collect()
+        assert ref() is None
+        assert len(Observer(config).load_outcomes(days=1)) == 1
+
+    def test_async_write_error_surfaces_on_flush(self, tmp_path):
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        observer = Observer(Config(data_dir=str(blocker), async_writes=True))
+        observer.record_simple("task1", success=True)
+        with pytest.raises(OSError):
+            observer.flush()
+        observer.flush()  # Reported once
+        observer.close()
+
+    def test_write_all_retries_short_writes(self):
+        class ShortWriter:
+            data = b""
+
+            def write(self, buf):
+                chunk = bytes(buf[:3])
+                self.data += chunk
+                return len(chunk)
+
+        fh = ShortWriter()
+        _write_all(fh, b"0123456789\n")
+        assert fh.data == b"0123456789\n"
+
     def test_load_outcomes_empty(self, observer):
         outcomes = observer.load_outcomes()
         assert outcomes == []
@@ -116,11 +307,23 @@ class TestObserver:
         assert "<ID>" in norm
         assert "<N>" in norm
 
+    def test_normalize_error_cached(self):
+        normalize_error.cache_clear()
+        first = Observer.normalize_error("429 Too Many Requests")
+        second = Observer.normalize_error("429 Too Many Requests")
+        assert first == second == "<N> too many requests"
+        assert normalize_error.cache_info().hits == 1
+
     def test_classify_error_multiple(self):
         # An error could match multiple classifiers
         issues = Observer._classify_error("Model not found, got 404")
         assert "missing_tool" in issues
 
+    def test_classify_error_no_duplicate_issues(self):
+        # Two classifier rows map to tool_error; it is reported once
+        issues = Observer._classify_error("403 Forbidden: connection refused")
+        assert issues == ["tool_error"]
+
     def test_record_with_tags_and_metadata(self, observer):
         outcome = Outcome(
             task_type="analysis",